@@ -749,14 +749,15 @@ class FeedbackDataset:
                 features[field.name] = Value(dtype="string", id="field")
                 if field.name not in dataset:
                     dataset[field.name] = []
+            question_type_to_value = {
+                "text": Value(dtype="string"),
+                "label_selection": Value(dtype="string"),
+                "rating": Value(dtype="int32"),
+                "multi_label_selection": Sequence(Value(dtype="string")),
+            }
             for question in self.questions:
-                if question.settings["type"] in ["text", "label_selection"]:
-                    value = Value(dtype="string")
-                elif question.settings["type"] == "rating":
-                    value = Value(dtype="int32")
-                elif question.settings["type"] == "multi_label_selection":
-                    value = Sequence(Value(dtype="string"))
-                else:
+                value = question_type_to_value.get(question.settings["type"])
+                if value is None:
                     raise ValueError(
                         f"Question {question.name} has an unsupported type: {question.settings['type']}, for the"
                         " moment only the following types are supported: 'text', 'rating', 'label_selection', and"
@@ -779,19 +780,24 @@ class FeedbackDataset:
             for record in self.records:
                 for field in self.fields:
                     dataset[field.name].append(record.fields[field.name])
-                for question in self.questions:
-                    dataset[question.name].append(
-                        {
-                            "user_id": [r.user_id for r in record.responses],
-                            "value": [
-                                r.values[question.name].value if question.name in r.values else None
-                                for r in record.responses
-                            ],
-                            "status": [r.status for r in record.responses],
-                        }
-                        if record.responses
-                        else None
-                    )
+                if not record.responses:
+                    for question in self.questions:
+                        dataset[question.name].append(None)
+                else:
+                    # `user_id` and `status` are shared by all the questions, so they're only collected once per record
+                    user_ids = [r.user_id for r in record.responses]
+                    statuses = [r.status for r in record.responses]
+                    for question in self.questions:
+                        dataset[question.name].append(
+                            {
+                                "user_id": user_ids,
+                                "value": [
+                                    r.values[question.name].value if question.name in r.values else None
+                                    for r in record.responses
+                                ],
+                                "status": statuses,
+                            }
+                        )
                 dataset["metadata"].append(json.dumps(record.metadata) if record.metadata else None)
                 dataset["external_id"].append(record.external_id or None)
 
@@ -935,15 +941,16 @@ class FeedbackDataset:
                 )
             hfds = hfds[list(hfds.keys())[0]]
 
-        for index in range(len(hfds)):
+        records = []
+        for hfrecord in hfds:
             responses = {}
             for question in cls.questions:
-                if hfds[index][question.name] is None or len(hfds[index][question.name]) < 1:
+                if hfrecord[question.name] is None or len(hfrecord[question.name]) < 1:
                     continue
                 for user_id, value, status in zip(
-                    hfds[index][question.name]["user_id"],
-                    hfds[index][question.name]["value"],
-                    hfds[index][question.name]["status"],
+                    hfrecord[question.name]["user_id"],
+                    hfrecord[question.name]["value"],
+                    hfrecord[question.name]["status"],
                 ):
                     if user_id not in responses:
                         responses[user_id] = {
@@ -954,16 +961,17 @@ class FeedbackDataset:
                     responses[user_id]["values"].update({question.name: {"value": value}})
 
             metadata = None
-            if "metadata" in hfds[index] and hfds[index]["metadata"] is not None:
-                metadata = json.loads(hfds[index]["metadata"])
-
-            cls.__records.append(
-                FeedbackRecord(
-                    fields={field.name: hfds[index][field.name] for field in cls.fields},
-                    metadata=metadata,
-                    responses=list(responses.values()) or None,
-                    external_id=hfds[index]["external_id"],
-                )
+            if "metadata" in hfrecord and hfrecord["metadata"] is not None:
+                metadata = json.loads(hfrecord["metadata"])
+
+            records.append(
+                {
+                    "fields": {field.name: hfrecord[field.name] for field in cls.fields},
+                    "metadata": metadata,
+                    "responses": list(responses.values()) or None,
+                    "external_id": hfrecord["external_id"],
+                }
             )
+        cls.__records += parse_obj_as(List[FeedbackRecord], records)
         del hfds
         return cls
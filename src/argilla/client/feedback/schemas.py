@@ -48,6 +48,9 @@ class ValueSchema(BaseModel):
 
     value: Union[StrictStr, StrictInt, List[str]]
 
+    class Config:
+        copy_on_model_validation = "none"
+
 
 class ResponseSchema(BaseModel):
     """A response schema for a record.
@@ -86,6 +89,9 @@ class ResponseSchema(BaseModel):
             )
         return v
 
+    class Config:
+        copy_on_model_validation = "none"
+
 
 class FeedbackRecord(BaseModel):
     """A feedback record.
@@ -121,11 +127,11 @@ class FeedbackRecord(BaseModel):
 
     @validator("responses", always=True)
     def responses_must_be_a_list(cls, v: Optional[Union[ResponseSchema, List[ResponseSchema]]]) -> List[ResponseSchema]:
-        if not v:
-            return []
+        if isinstance(v, list):
+            return v
         if isinstance(v, ResponseSchema):
             return [v]
-        return v
+        return []
 
     class Config:
         extra = Extra.ignore
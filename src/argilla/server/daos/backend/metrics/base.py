@@ -116,21 +116,55 @@ class HistogramAggregation(ElasticsearchMetric):
     fixed_interval:
         If provided, it will used ALWAYS as the histogram
         aggregation interval
+    sample_shard_size:
+        If provided, the histogram will be computed only over the top
+        scoring documents of each shard, up to this number. This is not
+        a random sample: with constant score queries (filters) documents
+        are taken in index order, so the result may be biased
     """
 
     field: str
     script: Optional[Union[str, Dict[str, Any]]] = None
     fixed_interval: Optional[float] = None
+    sample_shard_size: Optional[int] = None
 
     def _build_aggregation(self, interval: Optional[float] = None) -> Dict[str, Any]:
         if self.fixed_interval:
             interval = self.fixed_interval
 
+        if not self.sample_shard_size:
+            return self._histogram_aggregation(interval)
+
+        return aggregations.sampler_aggregation(
+            shard_size=self.sample_shard_size,
+            inner_aggregation={self.id: self._histogram_aggregation(interval)},
+        )
+
+    def _histogram_aggregation(self, interval: Optional[float]) -> Dict[str, Any]:
+        # Kept out of `_build_aggregation` since its local names are used as metric arguments
         return aggregations.histogram_aggregation(field_name=self.field, script=self.script, interval=interval)
 
 
 @dataclasses.dataclass
 class TermsAggregation(ElasticsearchMetric):
+    """
+    Base elasticsearch terms aggregation metric
+
+    Attributes
+    ----------
+    field:
+        The terms field
+    script:
+        If provided, it will be used as scripted field
+        for aggregation
+    fixed_size:
+        If provided, it will used ALWAYS as the number of buckets
+    default_size:
+        The number of buckets when no size is requested
+    missing:
+        If provided, the bucket key for documents without value
+    """
+
     field: str = None
     script: Union[str, Dict[str, Any]] = None
     fixed_size: Optional[int] = None
@@ -225,7 +225,7 @@ class aggregations:
 
     @staticmethod
     def nested_aggregation(nested_path: str, inner_aggregation: Dict[str, Any]) -> Dict[str, Any]:
-        inner_meta = list(inner_aggregation.values())[0].get("meta", {})
+        inner_meta = next(iter(inner_aggregation.values())).get("meta", {})
         return {
             "meta": {
                 "kind": inner_meta.get("kind", "custom"),
@@ -234,6 +234,18 @@ class aggregations:
             "aggs": inner_aggregation,
         }
 
+    @staticmethod
+    def sampler_aggregation(shard_size: int, inner_aggregation: Dict[str, Any]) -> Dict[str, Any]:
+        """Computes the inner aggregation over the top `shard_size` scoring documents of each shard"""
+        inner_meta = next(iter(inner_aggregation.values())).get("meta", {})
+        return {
+            "meta": {
+                "kind": inner_meta.get("kind", "custom"),
+            },
+            "sampler": {"shard_size": shard_size},
+            "aggs": inner_aggregation,
+        }
+
     @staticmethod
     def bidimentional_terms_aggregations(field_name_x: str, field_name_y: str, size=DEFAULT_AGGREGATION_SIZE):
         return {
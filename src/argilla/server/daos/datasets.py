@@ -162,15 +162,12 @@ class DatasetsDAO:
         def dict_to_key_value_list(data: Dict[str, Any]) -> List[Dict[str, Any]]:
             return [{"key": key, "value": json.dumps(value)} for key, value in data.items()]
 
+        # `dict` already returns a fresh dict, so it can be updated in place instead of copied again
         data = dataset.dict(by_alias=True)
-        tags = data.get("tags", {})
-        metadata = data.get("metadata", {})
+        data["tags"] = dict_to_key_value_list(data.get("tags", {}))
+        data["metadata"] = dict_to_key_value_list(data.get("metadata", {}))
 
-        return {
-            **data,
-            "tags": dict_to_key_value_list(tags),
-            "metadata": dict_to_key_value_list(metadata),
-        }
+        return data
 
     def copy(self, source: DatasetDB, target: DatasetDB):
         document = self._es.find_dataset(id=source.id)
@@ -71,10 +71,9 @@ class BaseDatasetDB(BaseModel):
         Extends base component dict extending object properties
         and user defined extended fields
         """
-        return {
-            **super().dict(*args, **kwargs),
-            "id": self.id,
-        }
+        data = super().dict(*args, **kwargs)
+        data["id"] = self.id
+        return data
 
 
 class EmbeddingsConfig(BaseModel):
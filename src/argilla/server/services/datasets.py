@@ -77,10 +77,14 @@ class DatasetsService:
             # The dataset does not exist -> create it !
             date_now = datetime.utcnow()
 
-            new_dataset = BaseDatasetDB.parse_obj(dataset.dict())
-            new_dataset.created_by = user.username
-            new_dataset.created_at = date_now
-            new_dataset.last_updated = date_now
+            new_dataset = BaseDatasetDB.parse_obj(
+                {
+                    **dataset.dict(),
+                    "created_by": user.username,
+                    "created_at": date_now,
+                    "last_updated": date_now,
+                }
+            )
 
             return self.__dao__.create_dataset(new_dataset)
 
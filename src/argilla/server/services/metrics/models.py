@@ -84,6 +84,22 @@ class ServiceBaseTaskMetrics(BaseModel):
     """
 
     metrics: ClassVar[List[Union[ServicePythonMetric, str]]]
+    _metrics_by_id: ClassVar[Dict[str, Union[ServicePythonMetric, str]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_metrics_index()
+
+    @classmethod
+    def _build_metrics_index(cls):
+        """
+        Builds the metric id lookup used by ``find_metric``. Must be called again
+        if the ``metrics`` list of a task is modified after the class definition
+        """
+        metrics_by_id = {}
+        for metric in getattr(cls, "metrics", []):
+            metrics_by_id.setdefault(metric if isinstance(metric, str) else metric.id, metric)
+        cls._metrics_by_id = metrics_by_id
 
     @classmethod
     def find_metric(cls, id: str) -> Optional[Union[ServicePythonMetric, str]]:
@@ -100,11 +116,7 @@ class ServiceBaseTaskMetrics(BaseModel):
             Found metric if any, ``None`` otherwise
 
         """
-        for metric in cls.metrics:
-            if isinstance(metric, str) and metric == id:
-                return metric
-            if metric.id == id:
-                return metric
+        return cls._metrics_by_id.get(id)
 
     @classmethod
     def record_metrics(cls, record: ServiceRecord) -> Dict[str, Any]:
@@ -13,15 +13,18 @@
 #  limitations under the License.
 import logging
 import os
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 from uuid import uuid4
 
-from datasets import DatasetDict
+from datasets import Dataset, DatasetDict
 
 import argilla as rg
 from argilla.training.base import ArgillaTrainerSkeleton
 from argilla.utils.dependency import require_version
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class AutoTrainMixIn:
     def prepare_dataset(self, data_dict_params: Optional[dict] = {}) -> None:
@@ -134,13 +137,13 @@ class ArgillaAutoTrainTrainer(ArgillaTrainerSkeleton, AutoTrainMixIn):
         if isinstance(self._dataset, DatasetDict):
             self._train_dataset = self._dataset["train"]
             self._eval_dataset = self._dataset["test"]
-            data_dict["valid_data"] = [self._eval_dataset.to_pandas()]
+            data_dict["valid_data"] = [self._dataset_to_pandas(self._eval_dataset)]
             self._num_samples += len(self._eval_dataset)
         else:
             self._train_dataset = self._dataset
             self._eval_dataset = None
             data_dict["valid_data"] = []
-        data_dict["train_data"] = [self._train_dataset.to_pandas()]
+        data_dict["train_data"] = [self._dataset_to_pandas(self._train_dataset)]
         self._num_samples += len(self._train_dataset)
 
         if self._record_class == rg.TextClassificationRecord:
@@ -170,6 +173,16 @@ class ArgillaAutoTrainTrainer(ArgillaTrainerSkeleton, AutoTrainMixIn):
         self.prepare_dataset(data_dict=data_dict)
         self.initialize_project()
 
+    @staticmethod
+    def _dataset_to_pandas(dataset: Dataset) -> "pd.DataFrame":
+        """
+        Converts a `datasets.Dataset` into a `pandas.DataFrame` keeping one block per column, so that
+        the Arrow buffers are not consolidated into a second copy of the data while converting.
+        """
+        # `with_format("arrow")[:]` applies the indices mapping (e.g. after `train_test_split`) and returns
+        # a new `pyarrow.Table`, which can be safely released column by column via `self_destruct`
+        return dataset.with_format("arrow")[:].to_pandas(split_blocks=True, self_destruct=True)
+
     def init_training_args(self):
         from autotrain.params import Params
 
@@ -83,8 +83,15 @@ def mock_search_engine(mocker) -> Generator["SearchEngine", None, None]:
     return mocker.AsyncMock(SearchEngine)
 
 
+@pytest.fixture(scope="session")
+def app_lifespan() -> Generator[None, None, None]:
+    # Run the app startup and shutdown events once per test session instead of once per test
+    with TestClient(app):
+        yield
+
+
 @pytest.fixture(scope="function")
-def client(request, mock_search_engine: SearchEngine) -> Generator[TestClient, None, None]:
+def client(request, app_lifespan: None, mock_search_engine: SearchEngine) -> Generator[TestClient, None, None]:
     session = TestSession()
 
     def override_get_db():
@@ -97,8 +104,7 @@ def client(request, mock_search_engine: SearchEngine) -> Generator[TestClient, N
     argilla_app.dependency_overrides[get_search_engine] = override_get_search_engine
 
     raise_server_exceptions = request.param if hasattr(request, "param") else False
-    with TestClient(app, raise_server_exceptions=raise_server_exceptions) as client:
-        yield client
+    yield TestClient(app, raise_server_exceptions=raise_server_exceptions)
 
     argilla_app.dependency_overrides.clear()
 
@@ -35,6 +35,17 @@ class BaseFactory(factory.alchemy.SQLAlchemyModelFactory):
         sqlalchemy_session = TestSession
         sqlalchemy_session_persistence = "flush"
 
+    @classmethod
+    def create_batch(cls, size: int, **kwargs):
+        # Persist the whole batch with a single flush instead of flushing once per instance
+        instances = cls.build_batch(size, **kwargs)
+
+        session = cls._meta.sqlalchemy_session
+        session.add_all(instances)
+        session.flush()
+
+        return instances
+
 
 class WorkspaceUserFactory(BaseFactory):
     class Meta:
@@ -116,13 +127,13 @@ class QuestionFactory(BaseFactory):
         model = Question
 
     @classmethod
-    def _create(cls, model_class, *args, **kwargs):
+    def _adjust_kwargs(cls, **kwargs):
         default_settings = cls.settings.copy()
         settings = kwargs.get("settings", {})
         if settings:
             default_settings.update(settings)
             kwargs["settings"] = default_settings
-        return super()._create(model_class, *args, **kwargs)
+        return kwargs
 
     name = factory.Sequence(lambda n: f"question-{n}")
     title = "Question Title"
@@ -0,0 +1,78 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla.server.daos.backend.metrics.base import HistogramAggregation
+from argilla.server.daos.backend.metrics.token_classification import (
+    TopKMentionsConsistency,
+)
+from argilla.server.daos.backend.query_helpers import parse_aggregations
+
+
+def test_top_k_mentions_consistency_metric_args():
+    metric = TopKMentionsConsistency(
+        id="consistency",
+        nested_path="mentions",
+        mention_field="value",
+        labels_field="label",
+    )
+
+    assert set(metric.metric_arg_names) == {"self", "size", "interval", "entity_size"}
+    assert metric.aggregation_request(size=10)
+
+
+@pytest.mark.parametrize("sample_shard_size", [None, 100])
+def test_histogram_aggregation_metric_args(sample_shard_size):
+    metric = HistogramAggregation(id="text_length", field="metrics.text_length", sample_shard_size=sample_shard_size)
+
+    assert set(metric.metric_arg_names) == {"self", "interval"}
+
+
+def test_histogram_aggregation():
+    metric = HistogramAggregation(id="text_length", field="metrics.text_length")
+
+    assert metric.aggregation_request(interval=1) == {
+        "text_length": {
+            "meta": {"kind": "histogram"},
+            "histogram": {"field": "metrics.text_length", "interval": 1},
+        }
+    }
+
+
+def test_histogram_aggregation_with_sample_shard_size():
+    metric = HistogramAggregation(id="text_length", field="metrics.text_length", sample_shard_size=100)
+
+    assert metric.aggregation_request(interval=1) == {
+        "text_length": {
+            "meta": {"kind": "histogram"},
+            "sampler": {"shard_size": 100},
+            "aggs": {
+                "text_length": {
+                    "meta": {"kind": "histogram"},
+                    "histogram": {"field": "metrics.text_length", "interval": 1},
+                }
+            },
+        }
+    }
+
+    es_aggregations = {
+        "text_length": {
+            "doc_count": 100,
+            "meta": {"kind": "histogram"},
+            "text_length": {"buckets": [{"key": 0.0, "doc_count": 60}, {"key": 1.0, "doc_count": 40}]},
+        }
+    }
+    results = parse_aggregations(es_aggregations)
+
+    assert metric.aggregation_result(results) == {0.0: 60, 1.0: 40}
@@ -0,0 +1,53 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from argilla.server.daos.backend.query_helpers import aggregations
+
+
+def test_terms_aggregation():
+    assert aggregations.terms_aggregation("label", size=10) == {
+        "meta": {"kind": "terms"},
+        "terms": {"field": "label", "size": 10, "order": {"_count": "desc"}},
+    }
+
+
+def test_terms_aggregation_with_script_and_missing():
+    assert aggregations.terms_aggregation(script="doc['label'].value", missing="none", size=None) == {
+        "meta": {"kind": "terms"},
+        "terms": {
+            "script": "doc['label'].value",
+            "size": aggregations.DEFAULT_AGGREGATION_SIZE,
+            "order": {"_count": "desc"},
+            "missing": "none",
+        },
+    }
+
+
+def test_terms_aggregation_size_is_capped():
+    terms = aggregations.terms_aggregation("label", size=aggregations.MAX_AGGREGATION_SIZE + 1)
+
+    assert terms["terms"]["size"] == aggregations.MAX_AGGREGATION_SIZE
+
+
+def test_bidimentional_terms_aggregations():
+    assert aggregations.bidimentional_terms_aggregations("x", "y", size=10) == {
+        "meta": {"kind": "2d-terms"},
+        "terms": {"field": "x", "size": 10, "order": {"_count": "desc"}},
+        "aggs": {
+            "y": {
+                "meta": {"kind": "terms"},
+                "terms": {"field": "y", "size": 10, "order": {"_count": "desc"}},
+            }
+        },
+    }
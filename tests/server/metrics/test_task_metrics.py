@@ -0,0 +1,31 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla.server.services.metrics.models import CommonTasksMetrics
+from argilla.server.services.tasks.text_classification.metrics import (
+    TextClassificationMetrics,
+)
+from argilla.server.services.tasks.token_classification.metrics import (
+    TokenClassificationMetrics,
+)
+
+
+@pytest.mark.parametrize("task_metrics", [CommonTasksMetrics, TextClassificationMetrics, TokenClassificationMetrics])
+def test_find_metric(task_metrics):
+    for metric in task_metrics.metrics:
+        assert task_metrics.find_metric(metric.id) is metric
+
+    assert task_metrics.find_metric("not-found") is None
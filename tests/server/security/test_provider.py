@@ -15,32 +15,39 @@
 import pytest
 from argilla._constants import DEFAULT_API_KEY
 from argilla.server.security.auth_provider.local.provider import (
+    LocalAuthProvider,
     create_local_auth_provider,
 )
 from fastapi.security import SecurityScopes
 from sqlalchemy.orm import Session
 
-localAuth = create_local_auth_provider()
 security_Scopes = SecurityScopes
 
 
+@pytest.fixture(scope="session")
+def local_auth() -> LocalAuthProvider:
+    return create_local_auth_provider()
+
+
+@pytest.fixture(scope="module")
+def argilla_token(local_auth: LocalAuthProvider) -> str:
+    return local_auth._create_access_token(username="argilla")
+
+
 # Tests for function get_user via token and api key
 @pytest.mark.asyncio
-async def test_get_user_via_token(db: Session, argilla_user):
-    access_token = localAuth._create_access_token(username="argilla")
-
-    user = localAuth.get_current_user(security_scopes=security_Scopes, db=db, token=access_token, api_key=None)
+async def test_get_user_via_token(db: Session, argilla_user, local_auth: LocalAuthProvider, argilla_token: str):
+    user = local_auth.get_current_user(security_scopes=security_Scopes, db=db, token=argilla_token, api_key=None)
     assert user.username == "argilla"
 
 
 @pytest.mark.asyncio
-async def test_get_user_via_api_key(db: Session, argilla_user):
-    user = localAuth.get_current_user(security_scopes=security_Scopes, db=db, api_key=DEFAULT_API_KEY, token=None)
+async def test_get_user_via_api_key(db: Session, argilla_user, local_auth: LocalAuthProvider):
+    user = local_auth.get_current_user(security_scopes=security_Scopes, db=db, api_key=DEFAULT_API_KEY, token=None)
     assert user.username == "argilla"
 
 
 # Test for function fetch token
-def test_fetch_token_user(db: Session, argilla_user):
-    access_token = localAuth._create_access_token(username="argilla")
-    user = localAuth.fetch_token_user(db=db, token=access_token)
+def test_fetch_token_user(db: Session, argilla_user, local_auth: LocalAuthProvider, argilla_token: str):
+    user = local_auth.fetch_token_user(db=db, token=argilla_token)
     assert user.username == "argilla"